@@ -1,15 +1,34 @@
 // Attendants API Route - Next.js API
 import { NextRequest, NextResponse } from 'next/server';
-import { PrismaClient } from '@prisma/client';
+import { prisma } from '../../../lib/prisma';
 
-const prisma = new PrismaClient();
+// The attendant list changes rarely, so keep the serialized JSON and reuse it
+// until the TTL lapses or an attendant is created through this route.
+// POST bumps the generation so a GET whose query started before the write
+// cannot store its stale list afterwards.
+const ATTENDANTS_TTL_MS = 5 * 60 * 1000;
+let cachedAttendants: { json: string; expiresAt: number } | null = null;
+let attendantsGeneration = 0;
 
 export async function GET() {
   try {
+    if (cachedAttendants && cachedAttendants.expiresAt > Date.now()) {
+      return new NextResponse(cachedAttendants.json, {
+        headers: { 'Content-Type': 'application/json' }
+      });
+    }
+
+    const readGeneration = attendantsGeneration;
     const attendants = await prisma.attendants.findMany({
       orderBy: { lastName: 'asc' }
     });
-    return NextResponse.json(attendants);
+    const json = JSON.stringify(attendants);
+    if (readGeneration === attendantsGeneration) {
+      cachedAttendants = { json, expiresAt: Date.now() + ATTENDANTS_TTL_MS };
+    }
+    return new NextResponse(json, {
+      headers: { 'Content-Type': 'application/json' }
+    });
   } catch (error) {
     console.error('Failed to fetch attendants:', error);
     return NextResponse.json({ error: 'Failed to fetch attendants' }, { status: 500 });
@@ -35,6 +54,8 @@ export async function POST(request: NextRequest) {
         updatedAt: new Date()
       }
     });
+    attendantsGeneration++;
+    cachedAttendants = null;
 
     return NextResponse.json(attendant, { status: 201 });
   } catch (error) {
@@ -1,7 +1,6 @@
 // Attendants Search API Route - Next.js API
 import { NextRequest, NextResponse } from 'next/server';
-import { PrismaClient } from '@prisma/client';
-const prisma = new PrismaClient();
+import { prisma } from '../../../../lib/prisma';
 
 export async function GET(request: NextRequest) {
   try {
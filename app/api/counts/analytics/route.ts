@@ -1,25 +1,38 @@
 // Count Analytics API Route - Next.js API
 import { NextResponse } from 'next/server';
-import { PrismaClient } from '@prisma/client';
-const prisma = new PrismaClient();
+import { prisma } from '../../../../lib/prisma';
+import {
+  getCachedCountAnalytics,
+  getCountAnalyticsGeneration,
+  setCachedCountAnalytics
+} from '../../../../lib/countAnalyticsCache';
 
 export async function GET() {
   try {
-    const totalSessions = await prisma.count_sessions.count({ where: { isActive: true } });
-    const activeSessions = await prisma.count_sessions.count({ 
-      where: { 
-        isActive: true,
-        countTime: {
-          gte: new Date(Date.now() - 30 * 24 * 60 * 60 * 1000) // Last 30 days
+    const cached = getCachedCountAnalytics();
+    if (cached) {
+      return NextResponse.json(cached);
+    }
+
+    const readGeneration = getCountAnalyticsGeneration();
+    const [totalSessions, activeSessions] = await Promise.all([
+      prisma.count_sessions.count({ where: { isActive: true } }),
+      prisma.count_sessions.count({
+        where: {
+          isActive: true,
+          countTime: {
+            gte: new Date(Date.now() - 30 * 24 * 60 * 60 * 1000) // Last 30 days
+          }
         }
-      } 
-    });
+      })
+    ]);
     const analytics = {
       totalSessions,
       activeSessions,
       averageSessionsPerMonth: Math.round(totalSessions / 12),
       lastUpdated: new Date().toISOString()
     };
+    setCachedCountAnalytics(analytics, readGeneration);
     return NextResponse.json(analytics);
   } catch (error) {
     console.error('Failed to fetch count analytics:', error);
@@ -1,7 +1,6 @@
 // Generate Count Session Name API Route - Next.js API
 import { NextRequest, NextResponse } from 'next/server';
-import { PrismaClient } from '@prisma/client';
-const prisma = new PrismaClient();
+import { prisma } from '../../../../lib/prisma';
 
 export async function GET(request: NextRequest) {
   try {
@@ -30,8 +29,13 @@ export async function GET(request: NextRequest) {
     let sessionName = baseSessionName;
     let counter = 1;
     
-    // Check for existing sessions and increment counter if needed
-    while (await prisma.count_sessions.findFirst({ where: { sessionName } })) {
+    // Fetch every name sharing the base once, then pick the first free suffix in memory
+    const existingSessions = await prisma.count_sessions.findMany({
+      where: { sessionName: { startsWith: baseSessionName } },
+      select: { sessionName: true }
+    });
+    const takenNames = new Set(existingSessions.map(session => session.sessionName));
+    while (takenNames.has(sessionName)) {
       sessionName = `${baseSessionName} (${counter})`;
       counter++;
     }
@@ -1,13 +1,15 @@
 // Count Sessions API Route - Next.js API
 import { NextRequest, NextResponse } from 'next/server';
-import { PrismaClient } from '@prisma/client';
-const prisma = new PrismaClient();
+import { prisma } from '../../../lib/prisma';
+import { invalidateCountAnalytics } from '../../../lib/countAnalyticsCache';
 
 export async function GET() {
   try {
     const countSessions = await prisma.count_sessions.findMany({
       include: {
-        events: true
+        events: {
+          select: { id: true, name: true, location: true, startDate: true }
+        }
       },
       orderBy: { countTime: 'desc' }
     });
@@ -44,9 +46,12 @@ export async function POST(request: NextRequest) {
         updatedAt: new Date()
       },
       include: {
-        events: true
+        events: {
+          select: { id: true, name: true, location: true, startDate: true }
+        }
       }
     });
+    invalidateCountAnalytics();
 
     return NextResponse.json(countSession, { status: 201 });
   } catch (error) {
@@ -1,7 +1,6 @@
 // Count Sessions Search API Route - Next.js API
 import { NextRequest, NextResponse } from 'next/server';
-import { PrismaClient } from '@prisma/client';
-const prisma = new PrismaClient();
+import { prisma } from '../../../../lib/prisma';
 
 export async function GET(request: NextRequest) {
   try {
@@ -24,7 +23,9 @@ export async function GET(request: NextRequest) {
         isActive: true
       },
       include: {
-        events: true
+        events: {
+          select: { id: true, name: true, location: true, startDate: true }
+        }
       },
       orderBy: { countTime: 'desc' }
     });
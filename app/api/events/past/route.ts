@@ -1,7 +1,6 @@
 // Past Events API Route - Next.js API
 import { NextResponse } from 'next/server';
-import { PrismaClient } from '@prisma/client';
-const prisma = new PrismaClient();
+import { prisma } from '../../../../lib/prisma';
 
 export async function GET() {
   try {
@@ -9,12 +9,14 @@ const axios = require('axios');
 const { JSDOM } = require('jsdom');
 
 const STAGING_BASE_URL = 'http://10.92.3.24:3001';
+const LINK_CHECK_CONCURRENCY = 8;
 
 class StagingTestAgent {
     constructor(name, focus) {
         this.name = name;
         this.focus = focus;
         this.results = [];
+        this.checkedLinks = new Set();
     }
 
     async log(message, status = 'INFO') {
@@ -47,13 +49,26 @@ class StagingTestAgent {
             const links = Array.from(document.querySelectorAll('a[href]'));
             await this.log(`Found ${links.length} links on ${url}`, 'INFO');
             
+            // Navbar/footer links repeat on every page; check each one only once
+            const hrefs = [];
             for (const link of links) {
                 const href = link.getAttribute('href');
-                if (href.startsWith('/')) {
-                    await this.testEndpoint(href);
+                if (href.startsWith('/') && !this.checkedLinks.has(href)) {
+                    this.checkedLinks.add(href);
+                    hrefs.push(href);
                 }
             }
             
+            // Check links with a bounded pool of concurrent requests
+            let next = 0;
+            const worker = async () => {
+                while (next < hrefs.length) {
+                    await this.testEndpoint(hrefs[next++]);
+                }
+            };
+            const workerCount = Math.min(LINK_CHECK_CONCURRENCY, hrefs.length);
+            await Promise.all(Array.from({ length: workerCount }, worker));
+            
             return links.length;
         } catch (error) {
             await this.log(`❌ Failed to test links on ${url}: ${error.message}`, 'ERROR');
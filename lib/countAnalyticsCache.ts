@@ -0,0 +1,37 @@
+// Count Analytics Cache - short-lived in-process cache shared by the count routes
+
+const ANALYTICS_TTL_MS = 30 * 1000;
+
+// Kept on globalThis so every route bundle in the process sees the same cache.
+// The generation is bumped on every invalidation so a read that started before
+// a write cannot store its stale result afterwards.
+const globalForAnalytics = globalThis as unknown as {
+  countAnalyticsCache?: {
+    entry: { body: object; expiresAt: number } | null;
+    generation: number;
+  };
+};
+
+const cache = (globalForAnalytics.countAnalyticsCache ??= { entry: null, generation: 0 });
+
+export function getCachedCountAnalytics(): object | null {
+  if (cache.entry && cache.entry.expiresAt > Date.now()) {
+    return cache.entry.body;
+  }
+  return null;
+}
+
+export function getCountAnalyticsGeneration(): number {
+  return cache.generation;
+}
+
+export function setCachedCountAnalytics(body: object, readGeneration: number) {
+  if (readGeneration === cache.generation) {
+    cache.entry = { body, expiresAt: Date.now() + ANALYTICS_TTL_MS };
+  }
+}
+
+export function invalidateCountAnalytics() {
+  cache.generation++;
+  cache.entry = null;
+}
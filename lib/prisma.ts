@@ -0,0 +1,13 @@
+// Shared Prisma Client - one connection pool per server process
+import { PrismaClient } from '@prisma/client';
+
+// Pool size and wait time come from DATABASE_URL (connection_limit, pool_timeout).
+// Reuse the client across hot reloads in development so each reload does not
+// open another pool.
+const globalForPrisma = globalThis as unknown as { prisma?: PrismaClient };
+
+export const prisma = globalForPrisma.prisma ?? new PrismaClient();
+
+if (process.env.NODE_ENV !== 'production') {
+  globalForPrisma.prisma = prisma;
+}
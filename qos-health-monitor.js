@@ -140,12 +140,19 @@ class QOSHealthMonitor {
       '/api/users'
     ];
     
-    for (const endpoint of apiEndpoints) {
+    // Endpoints are independent, so fetch them concurrently and report in order
+    const outcomes = await Promise.all(apiEndpoints.map(async (endpoint) => {
+      const start = Date.now();
       try {
-        const start = Date.now();
         const response = await axios.get(`${STAGING_URL}${endpoint}`, { timeout: 5000 });
-        const responseTime = Date.now() - start;
-        
+        return { endpoint, response, responseTime: Date.now() - start };
+      } catch (error) {
+        return { endpoint, error };
+      }
+    }));
+    
+    for (const { endpoint, response, responseTime, error } of outcomes) {
+      if (!error) {
         // Check if congregation field is present in attendants/users
         let hasCongregationField = false;
         if (endpoint.includes('attendants') || endpoint.includes('users')) {
@@ -166,7 +173,7 @@ class QOSHealthMonitor {
         const congregationStatus = hasCongregationField ? '✅ Congregation field' : '❌ No congregation field';
         console.log(`   ${response.status === 200 ? '✅' : '❌'} ${endpoint}: ${response.status} (${responseTime}ms) ${endpoint.includes('attendants') || endpoint.includes('users') ? congregationStatus : ''}`);
         
-      } catch (error) {
+      } else {
         this.results.api_checks.push({
           endpoint,
           status: 'FAIL',